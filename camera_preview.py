@@ -0,0 +1,58 @@
+"""
+Camera Preview Module for Nokia Snake Game
+Shares webcam frames with the pygame window as a picture-in-picture
+"""
+
+import threading
+import cv2
+import numpy as np
+import pygame
+from typing import Tuple
+
+class CameraPreview:
+    def __init__(self, size: Tuple[int, int] = (160, 120)):
+        """
+        Initialize double-buffered preview storage
+
+        Args:
+            size: (width, height) of the picture-in-picture preview
+        """
+        self.size = size
+        width, height = size
+
+        # Two BGR buffers, allocated once and reused for every frame.
+        # Each pygame surface wraps its buffer directly, so writing a new
+        # frame into the array updates the surface with no upload copy.
+        self.buffers = [np.zeros((height, width, 3), dtype=np.uint8) for _ in range(2)]
+        self.surfaces = [pygame.image.frombuffer(buffer, size, "BGR") for buffer in self.buffers]
+
+        # The gesture thread fills the back buffer while the game draws the front
+        self.front = 0
+        self.has_frame = False
+        self.lock = threading.Lock()
+
+    def publish(self, frame: np.ndarray):
+        """
+        Write a frame into the back buffer and make it visible (gesture thread)
+
+        Args:
+            frame: BGR video frame of any size
+        """
+        back = 1 - self.front
+        cv2.resize(frame, self.size, dst=self.buffers[back], interpolation=cv2.INTER_AREA)
+
+        with self.lock:
+            self.front = back
+            self.has_frame = True
+
+    def draw(self, surface: pygame.Surface, position: Tuple[int, int]):
+        """
+        Blit the latest published frame onto a surface (main thread)
+
+        Args:
+            surface: Destination surface, usually the game screen
+            position: Top-left corner of the preview
+        """
+        with self.lock:
+            if self.has_frame:
+                surface.blit(self.surfaces[self.front], position)
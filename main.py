@@ -7,14 +7,26 @@ import cv2
 import pygame
 import threading
 import time
+from camera_preview import CameraPreview
 from gesture_controller import GestureController
 from snake_game import SnakeGame
 
 class GameManager:
-    def __init__(self):
-        """Initialize the game manager"""
+    def __init__(self, single_window: bool = True):
+        """
+        Initialize the game manager
+        
+        Args:
+            single_window: Show the webcam feed inside the game window
+                instead of a separate OpenCV window
+        """
         self.game = SnakeGame()
         self.gesture_controller = GestureController()
+        self.single_window = single_window
+        self.camera_preview = None
+        if self.single_window:
+            self.camera_preview = CameraPreview()
+            self.game.set_camera_preview(self.camera_preview)
         self.cap = None
         self.running = True
         self.gesture_thread = None
@@ -52,13 +64,17 @@ class GameManager:
             self.current_gesture = gesture
             self.is_speed_boost = pinch
             
-            # Display gesture window
-            cv2.imshow('Nokia Snake - Gesture Control', annotated_frame)
-            
-            # Handle window close
-            if cv2.waitKey(1) & 0xFF == ord('q'):
-                self.running = False
-                break
+            if self.single_window:
+                # Hand frame to the game window (drawn by the main thread)
+                self.camera_preview.publish(annotated_frame)
+            else:
+                # Display gesture window
+                cv2.imshow('Nokia Snake - Gesture Control', annotated_frame)
+                
+                # Handle window close
+                if cv2.waitKey(1) & 0xFF == ord('q'):
+                    self.running = False
+                    break
             
             time.sleep(0.033)  # ~30 FPS
     
@@ -79,8 +95,11 @@ class GameManager:
         print("- Pinch thumb and index finger for speed boost")
         print("- Show 'UP' gesture when game over to restart")
         print("- Press ESC in game window to quit")
-        print("\nGame Window: Classic Nokia Snake")
-        print("Gesture Window: Webcam feed with hand tracking")
+        if self.single_window:
+            print("\nGame Window: Classic Nokia Snake with webcam preview")
+        else:
+            print("\nGame Window: Classic Nokia Snake")
+            print("Gesture Window: Webcam feed with hand tracking")
         
         # Main game loop
         last_update = time.time()
@@ -125,7 +144,8 @@ class GameManager:
         if self.cap is not None:
             self.cap.release()
         
-        cv2.destroyAllWindows()
+        if not self.single_window:
+            cv2.destroyAllWindows()
         self.game.quit()
         
         if self.gesture_thread and self.gesture_thread.is_alive():
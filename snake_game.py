@@ -48,6 +48,9 @@ class SnakeGame:
         # Particle effects
         self.particles = []
         
+        # Optional picture-in-picture camera preview
+        self.camera_preview = None
+        
     def reset_game(self):
         """Reset game to initial state"""
         # Snake initialization
@@ -124,6 +127,10 @@ class SnakeGame:
             if new_dir != opposite.get(self.direction):
                 self.next_direction = new_dir
     
+    def set_camera_preview(self, preview):
+        """Set camera preview shown inside the game window"""
+        self.camera_preview = preview
+    
     def set_speed_boost(self, boost: bool):
         """Set speed boost state"""
         self.speed_boost = boost
@@ -255,8 +262,25 @@ class SnakeGame:
         # Draw UI
         self.draw_ui()
         
+        # Draw camera preview on top so the hand stays visible on game over
+        if self.camera_preview is not None:
+            self.draw_camera_preview(self.screen)
+        
         pygame.display.flip()
     
+    def draw_camera_preview(self, surface):
+        """Draw webcam feed as picture-in-picture in the bottom-right corner"""
+        preview_width, preview_height = self.camera_preview.size
+        pixel_x = self.width - preview_width - 10
+        pixel_y = self.height - preview_height - 10
+        
+        self.camera_preview.draw(surface, (pixel_x, pixel_y))
+        
+        # Border to match the Nokia theme
+        border_rect = pygame.Rect(pixel_x - 2, pixel_y - 2, 
+                                preview_width + 4, preview_height + 4)
+        pygame.draw.rect(surface, self.NOKIA_GREEN, border_rect, 2)
+    
     def draw_ui(self):
         """Draw user interface elements"""
         # Score